@@ -1,5 +1,6 @@
 import os
 import pathlib
+from typing import Optional
 
 from metricflow.configuration.constants import CONFIG_PATH_KEY
 from metricflow.configuration.yaml_handler import YamlFileHandler
@@ -9,26 +10,35 @@ class ConfigHandler(YamlFileHandler):
     """Class to handle all config file retrieval/insertion actions."""
 
     def __init__(self) -> None:  # noqa: D
+        # The config paths are derived from the environment, which we treat as
+        # fixed for the lifetime of the handler - resolve them once here
+        # instead of re-reading the env var (and re-allocating Path objects)
+        # on every property access.
+        config_dir_env = os.getenv(CONFIG_PATH_KEY)
+        self._dir_path = config_dir_env if config_dir_env else f"{str(pathlib.Path.home())}/.metricflow"
+        self._log_file_path: Optional[str] = None
         # Create config directory if not exist
-        dir_path = pathlib.Path(self.dir_path)
-        dir_path.mkdir(parents=True, exist_ok=True)
+        pathlib.Path(self._dir_path).mkdir(parents=True, exist_ok=True)
         super().__init__(yaml_file_path=self.file_path)
 
     @property
     def dir_path(self) -> str:
         """Retrieve MetricFlow config directory from $MF_CONFIG_DIR, default config dir is ~/.metricflow"""
-        config_dir_env = os.getenv(CONFIG_PATH_KEY)
-        return config_dir_env if config_dir_env else f"{str(pathlib.Path.home())}/.metricflow"
+        return self._dir_path
 
     @property
     def file_path(self) -> str:
         """Config file can be found at <config_dir>/config.yml"""
-        return os.path.join(self.dir_path, "config.yml")
+        return os.path.join(self._dir_path, "config.yml")
 
     @property
     def log_file_path(self) -> str:
-        """Returns the name of the log file where all logging messages are stored."""
-        log_dir_elements = [self.dir_path, "logs"]
-        log_dir = os.path.join(*log_dir_elements)
-        os.makedirs(log_dir, exist_ok=True)
-        return os.path.join(*(log_dir_elements + ["metricflow.log"]))
+        """Returns the name of the log file where all logging messages are stored.
+
+        The log directory is only stat'd/created on the first access.
+        """
+        if self._log_file_path is None:
+            log_dir = os.path.join(self._dir_path, "logs")
+            os.makedirs(log_dir, exist_ok=True)
+            self._log_file_path = os.path.join(log_dir, "metricflow.log")
+        return self._log_file_path
@@ -1,5 +1,5 @@
 import textwrap
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from metricflow.model.parsing.yaml_loader import ParsingContext
 
@@ -11,9 +11,22 @@ class CustomerFacingSemanticException(Exception):
 
 
 class UnableToSatisfyQueryError(CustomerFacingSemanticException):  # noqa:D
-    def __init__(self, error_name: str, context: Dict[str, str] = None) -> None:  # noqa:D
-        """Context will be printed as list of items when this is converted to a string."""
+    def __init__(
+        self,
+        error_name: str,
+        context: Dict[str, str] = None,
+        suggestions: Optional[Dict[str, List[str]]] = None,
+    ) -> None:  # noqa:D
+        """Context will be printed as list of items when this is converted to a string.
+
+        `suggestions` maps each unknown input name to the candidate names it
+        might have meant. It exists for structured (programmatic) access -
+        e.g. asserting on suggestions in tests without formatting the whole
+        error string - while `context` carries the pre-formatted sections
+        shown to the user.
+        """
         self.error_name = error_name
+        self.suggestions = suggestions
         self._context = context
 
     def __str__(self) -> str:  # noqa:D
@@ -10,15 +10,51 @@ from pydantic import BaseModel, root_validator
 from metricflow.errors.errors import ParsingException
 from metricflow.model.parsing.yaml_loader import ParsingContext, PARSING_CONTEXT_KEY
 
+try:
+    # orjson serializes/parses JSON several times faster than the stdlib with
+    # fewer intermediate allocations, which matters because model objects are
+    # serialized on every __hash__ call. It's an optional speedup though - the
+    # stdlib json module is used when it isn't installed.
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 # Type alias for the implicit "Any" type used as input and output for Pydantic's parsing API
 PydanticParseableValueType = Any  # type: ignore[misc]
 
 
+def _json_dumps(value: Any, *, default: Callable, sort_keys: bool = False, **kwargs: Any) -> str:  # type: ignore[misc]
+    """JSON serializer pydantic calls for `.json()`, using orjson when available
+
+    Accepts (a subset of) stdlib `json.dumps` keyword arguments so existing
+    `.json(...)` call sites work against either backend.
+    """
+    if orjson is not None and not kwargs:
+        option = orjson.OPT_SORT_KEYS if sort_keys else 0
+        return orjson.dumps(value, default=default, option=option).decode()
+    return json.dumps(value, default=default, sort_keys=sort_keys, **kwargs)
+
+
+def _json_loads(value: str) -> Any:  # type: ignore[misc]
+    """JSON parser pydantic calls for `.parse_raw()`, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
 class HashableBaseModel(BaseModel):
     """Extends BaseModel with a generic hash function"""
 
+    class Config:
+        """Pydantic feature."""
+
+        json_dumps = _json_dumps
+        json_loads = _json_loads
+
     def __hash__(self) -> int:  # noqa: D
-        return hash(json.dumps(self.json(sort_keys=True), sort_keys=True))
+        # `self.json()` already produces a string; hashing it directly avoids
+        # the old pattern of re-encoding that string through json.dumps.
+        return hash(self.json(sort_keys=True))
 
 
 class FrozenBaseModel(HashableBaseModel):
@@ -1,11 +1,18 @@
+import functools
+import os
 from dataclasses import dataclass
 from dbt.lib import get_dbt_config
 from dbt import tracking
+from dbt.config.runtime import RuntimeConfig
 from dbt.parser.manifest import ManifestLoader as DbtManifestLoader, Manifest as DbtManifest
 from metricflow.model.model_transformer import ModelTransformer
 from metricflow.model.parsing.dir_to_model import ModelBuildResult
 from metricflow.model.transformations.dbt_to_metricflow import DbtManifestTransformer
-from typing import Optional
+from typing import Optional, Tuple
+
+# The files which determine a dbt project's RuntimeConfig. If any of them
+# change, cached configs/manifests built for the project are considered stale.
+DBT_CONFIG_FILES = ("dbt_project.yml", "profiles.yml", "packages.yml")
 
 
 @dataclass
@@ -19,26 +26,104 @@ class DbtProfileArgs:
 
     profile: Optional[str] = None
     target: Optional[str] = None
+    # dbt reads this attribute when setting its global flags. When None, dbt
+    # falls back to the user config/default for the flag, and the default
+    # *enables* partial parsing - the manifest loader reads/writes
+    # `target/partial_parse.msgpack` and only reparses changed project files.
+    # Setting it True/False explicitly overrides a user-config opt-out or
+    # forces a full reparse, respectively.
+    partial_parse: Optional[bool] = None
 
 
-def get_dbt_project_manifest(
-    directory: str, profile: Optional[str] = None, target: Optional[str] = None
-) -> DbtManifest:
-    """Builds the dbt Manifest object from the dbt project"""
+def dbt_config_file_mtimes(directory: str) -> Tuple[float, ...]:
+    """Modification times for the dbt config files of the given project directory
+
+    Files which don't exist are recorded as 0.0, so that creating a previously
+    absent file (e.g. adding a packages.yml) also invalidates cached results.
+    """
+    mtimes = []
+    for config_file in DBT_CONFIG_FILES:
+        config_file_path = os.path.join(directory, config_file)
+        mtimes.append(os.stat(config_file_path).st_mtime if os.path.exists(config_file_path) else 0.0)
+    return tuple(mtimes)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_dbt_config_cached(
+    directory: str,
+    profile: Optional[str],
+    target: Optional[str],
+    config_mtimes: Tuple[float, ...],
+    partial_parse: Optional[bool],
+) -> RuntimeConfig:
+    """Builds (or returns a cached) dbt RuntimeConfig for the given project directory
+
+    `config_mtimes` exists purely to invalidate stale cache entries - a changed
+    config file produces a new mtime tuple and thus a new cache key.
+    """
+    profile_args = DbtProfileArgs(profile=profile, target=target, partial_parse=partial_parse)
+    return get_dbt_config(project_dir=directory, args=profile_args)
+
 
-    profile_args = DbtProfileArgs(profile=profile, target=target)
-    dbt_config = get_dbt_config(project_dir=directory, args=profile_args)
+@functools.lru_cache(maxsize=8)
+def _get_dbt_project_manifest_cached(
+    directory: str,
+    profile: Optional[str],
+    target: Optional[str],
+    config_mtimes: Tuple[float, ...],
+    partial_parse: Optional[bool],
+) -> DbtManifest:
+    """Builds (or returns a cached) dbt Manifest for the given project directory"""
+    dbt_config = _get_dbt_config_cached(directory, profile, target, config_mtimes, partial_parse)
     # If we don't disable tracking, we have to setup a full
     # dbt User object to build the manifest
     tracking.disable_tracking()
+    # `get_full_manifest` wraps dbt's ManifestLoader, which honors the
+    # PARTIAL_PARSE flag set from the args above - dbt enables it by default,
+    # reusing `target/partial_parse.msgpack` and persisting it again after
+    # loading, so only changed project files get reparsed across processes.
     return DbtManifestLoader.get_full_manifest(config=dbt_config)
 
 
+def clear_manifest_cache() -> None:
+    """Drops all cached dbt RuntimeConfigs and Manifests (primarily for tests)"""
+    _get_dbt_config_cached.cache_clear()
+    _get_dbt_project_manifest_cached.cache_clear()
+
+
+def get_dbt_project_manifest(
+    directory: str,
+    profile: Optional[str] = None,
+    target: Optional[str] = None,
+    partial_parse: Optional[bool] = None,
+) -> DbtManifest:
+    """Builds the dbt Manifest object from the dbt project
+
+    Building the manifest (and the RuntimeConfig it needs) involves scanning
+    the project filesystem and parsing every model, which dominates the cost of
+    dbt project parsing. Because of this we cache the built manifest, keyed by
+    the project directory/profile/target and the mtimes of the project config
+    files. Note that edits to individual model files don't invalidate the
+    cache - use `clear_manifest_cache` if that freshness is required.
+
+    Across processes, dbt's own partial parsing (enabled by default) keeps
+    warm loads cheap by only reparsing project files which changed since
+    `target/partial_parse.msgpack` was written. Pass `partial_parse=False` to
+    force a full reparse, or `partial_parse=True` to override an opt-out in
+    the user's dbt config; `None` defers to dbt.
+    """
+    return _get_dbt_project_manifest_cached(
+        directory, profile, target, dbt_config_file_mtimes(directory), partial_parse
+    )
+
+
 def parse_dbt_project_to_model(
     directory: str, profile: Optional[str] = None, target: Optional[str] = None
 ) -> ModelBuildResult:
     """Parse dbt model files in the given directory to a UserConfiguredModel."""
-    manifest = get_dbt_project_manifest(directory=directory, profile=profile, target=target)
-    build_result = DbtManifestTransformer(manifest=manifest).build_user_configured_model()
+    transformer = DbtManifestTransformer(
+        manifest_factory=lambda: get_dbt_project_manifest(directory=directory, profile=profile, target=target)
+    )
+    build_result = transformer.build_user_configured_model()
     transformed_model = ModelTransformer.transform(model=build_result.model)
     return ModelBuildResult(model=transformed_model, issues=build_result.issues)
@@ -1,10 +1,11 @@
+import copy
 import logging
 import os
 from dataclasses import dataclass
 from string import Template
 import traceback
 import git
-from typing import Optional, Dict, List, Union, Type
+from typing import Optional, Dict, List, Tuple, Union, Type
 
 from jsonschema import exceptions
 
@@ -35,6 +36,10 @@ from metricflow.model.validations.validator_helpers import (
 
 logger = logging.getLogger(__name__)
 
+# Set this environment variable (to any non-empty value) to bypass the
+# in-memory cache of directory parse results, e.g. while debugging.
+METRICFLOW_YAML_CACHE_DISABLE_ENV = "METRICFLOW_YAML_CACHE_DISABLE"
+
 VERSION_KEY = "mf_config_schema"
 METRIC_TYPE = "metric"
 DATA_SOURCE_TYPE = "data_source"
@@ -101,6 +106,16 @@ def collect_yaml_config_file_paths(directory: str) -> List[str]:
     return config_file_paths
 
 
+# Caches directory parse results, which are deterministic given the config
+# file contents and the parse arguments making up the key.
+_DIRECTORY_PARSE_CACHE: Dict[Tuple, ModelBuildResult] = {}
+
+
+def clear_directory_parse_cache() -> None:
+    """Drops all cached directory parse results (primarily for tests)"""
+    _DIRECTORY_PARSE_CACHE.clear()
+
+
 def parse_directory_of_yaml_files_to_model(
     directory: str,
     template_mapping: Optional[Dict[str, str]] = None,
@@ -110,14 +125,40 @@ def parse_directory_of_yaml_files_to_model(
     """Parse files in the given directory to a UserConfiguredModel.
 
     Strings in the file following the Python string template format are replaced according to the template_mapping dict.
+
+    Parsing a directory is pure file I/O plus YAML parsing, so results are
+    cached in memory keyed on the collected file paths (with their mtimes) and
+    the parse arguments. Callers always receive a deep copy, so mutating a
+    returned model can't corrupt the cache. Set the
+    `METRICFLOW_YAML_CACHE_DISABLE` environment variable to bypass the cache.
     """
     file_paths = collect_yaml_config_file_paths(directory=directory)
-    return parse_yaml_file_paths_to_model(
-        file_paths=file_paths,
-        template_mapping=template_mapping,
-        apply_transformations=apply_transformations,
-        raise_issues_as_exceptions=raise_issues_as_exceptions,
+
+    if os.environ.get(METRICFLOW_YAML_CACHE_DISABLE_ENV):
+        return parse_yaml_file_paths_to_model(
+            file_paths=file_paths,
+            template_mapping=template_mapping,
+            apply_transformations=apply_transformations,
+            raise_issues_as_exceptions=raise_issues_as_exceptions,
+        )
+
+    cache_key = (
+        tuple(sorted((file_path, os.stat(file_path).st_mtime_ns) for file_path in file_paths)),
+        tuple(sorted(template_mapping.items())) if template_mapping else (),
+        apply_transformations,
+        raise_issues_as_exceptions,
     )
+    build_result = _DIRECTORY_PARSE_CACHE.get(cache_key)
+    if build_result is None:
+        build_result = parse_yaml_file_paths_to_model(
+            file_paths=file_paths,
+            template_mapping=template_mapping,
+            apply_transformations=apply_transformations,
+            raise_issues_as_exceptions=raise_issues_as_exceptions,
+        )
+        _DIRECTORY_PARSE_CACHE[cache_key] = build_result
+
+    return copy.deepcopy(build_result)
 
 
 def parse_yaml_file_paths_to_model(
@@ -1,8 +1,11 @@
+import os
+import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from operator import xor
 import traceback
-from typing import DefaultDict, Dict, List, Optional, Set
+from typing import Any, Callable, DefaultDict, Dict, Iterator, List, Optional, Set, Type, TypeVar
 from dbt.contracts.graph.nodes import Metric as DbtMetric, ModelNode as DbtModelNode
 from dbt.contracts.graph.unparsed import MetricFilter as DbtMetricFilter
 from dbt.exceptions import ref_invalid_args
@@ -14,6 +17,7 @@ from metricflow.model.objects.elements.dimension import Dimension, DimensionType
 from metricflow.model.objects.elements.identifier import Identifier
 from metricflow.model.objects.elements.measure import Measure
 from metricflow.model.objects.metric import Metric, MetricInputMeasure, MetricType, MetricTypeParams
+from metricflow.model.objects.base import HashableBaseModel
 from metricflow.model.objects.user_configured_model import UserConfiguredModel
 from metricflow.model.parsing.dir_to_model import ModelBuildResult
 from metricflow.model.validations.validator_helpers import ModelValidationResults, ValidationError, ValidationIssue
@@ -22,10 +26,17 @@ from metricflow.time.time_granularity import TimeGranularity
 
 @dataclass
 class TransformedDbtMetric:  # noqa: D
+    # One instance is allocated per dbt metric, so skip the per-instance
+    # __dict__ to reduce memory and speed up attribute access. Declared
+    # manually because `dataclass(slots=True)` requires Python 3.10+.
+    __slots__ = ("data_source", "metric")
+
     data_source: DataSource
     metric: Metric
 
 
+ModelObjectT = TypeVar("ModelObjectT", bound=HashableBaseModel)
+
 CALC_METHOD_TO_MEASURE_TYPE: Dict[str, AggregationType] = {
     "count": AggregationType.COUNT,
     "count_distinct": AggregationType.COUNT_DISTINCT,
@@ -45,16 +56,77 @@ class DbtManifestTransformer:
     allowing us to pass around fewer arguments (reducing the mental load)
     """
 
-    def __init__(self, manifest: DbtManifest) -> None:
+    def __init__(
+        self,
+        manifest: Optional[DbtManifest] = None,
+        manifest_factory: Optional[Callable[[], DbtManifest]] = None,
+        validate: bool = False,
+    ) -> None:
         """Constructor.
 
+        Exactly one of `manifest` and `manifest_factory` must be provided. A
+        factory defers the (expensive) manifest construction until the first
+        time `self.manifest` is accessed, so instantiating the transformer
+        stays cheap for callers which may never end up needing the manifest.
+
         Args:
             manifest: A dbt Manifest object
+            manifest_factory: A callable which builds a dbt Manifest object
+            validate: Run pydantic validation when building model elements.
+                The manifest's contents have already been validated by dbt, so
+                this defaults to False to skip re-validating every element.
         """
-        self.manifest = manifest
+        assert (manifest is None) != (
+            manifest_factory is None
+        ), "Exactly one of `manifest` and `manifest_factory` must be provided"
+        self._manifest = manifest
+        self._manifest_factory = manifest_factory
+        self._validate = validate
         self._time_dimension_stats: Optional[Dict[str, List[str]]] = None  # lazy load it
+        self._non_derived_metrics: Optional[List[DbtMetric]] = None  # lazy load it
         self._resolved_dbt_model_refs: Dict[int, DbtModelNode] = {}  # cache of resolved nodes
 
+    @property
+    def manifest(self) -> DbtManifest:
+        """The dbt Manifest to transform, built on first access when a factory was given"""
+        if self._manifest is None:
+            assert self._manifest_factory is not None
+            self._manifest = self._manifest_factory()
+        return self._manifest
+
+    def _build_element(self, element_class: Type[ModelObjectT], **kwargs: Any) -> ModelObjectT:  # type: ignore[misc]
+        """Constructs a model element, skipping pydantic validation unless requested
+
+        Element construction happens once per measure/dimension of every
+        metric, and pydantic's validator dispatch dominates that cost. Since
+        the inputs originate from dbt's already-validated manifest, we use
+        pydantic's `construct` (which skips validators but still applies field
+        defaults) unless the transformer was created with `validate=True`.
+        Callers are responsible for passing values of the field's declared
+        type (e.g. enum members rather than their string values).
+        """
+        if self._validate:
+            return element_class(**kwargs)
+        return element_class.construct(**kwargs)
+
+    @property
+    def non_derived_metrics(self) -> List[DbtMetric]:
+        """The manifest's non-derived metrics, materialized once and reused
+
+        Both the time dimension stats and the model build iterate the metrics
+        while skipping `derived` ones. Filtering the manifest a single time
+        avoids rescanning `manifest.metrics` (and re-checking the calculation
+        method) per consumer.
+        """
+        if self._non_derived_metrics is None:
+            self._non_derived_metrics = [
+                dbt_metric
+                for dbt_metric in self.manifest.metrics.values()
+                if dbt_metric.calculation_method != "derived"
+            ]
+
+        return self._non_derived_metrics
+
     @property
     def time_dimension_stats(self) -> Dict[str, List[str]]:
         """The stats on time dimensions from the dbt Manifest
@@ -65,9 +137,7 @@ class DbtManifestTransformer:
         dimension should be primary for
         """
         if not self._time_dimension_stats:
-            self._time_dimension_stats = self.collect_time_dimension_stats(
-                dbt_metrics=list(self.manifest.metrics.values())
-            )
+            self._time_dimension_stats = self.collect_time_dimension_stats(dbt_metrics=self.non_derived_metrics)
 
         return self._time_dimension_stats
 
@@ -87,15 +157,16 @@ class DbtManifestTransformer:
         ref, this method caches the resolved ref node and uses the cache when
         possible to avoid re-resolving nodes.
         """
-        if dbt_metric.model is None:
+        metric_model = dbt_metric.model
+        if metric_model is None:
             raise RuntimeError("Unable to resolve a model for a `DbtMetric.model` value of `None`")
 
         target_model: Optional[str] = None
         target_package = None
 
-        if dbt_metric.model[:4] == "ref(":
+        if metric_model[:4] == "ref(":
             # Parse the DbtMetric.model into it's parts
-            ref_parts = dbt_metric.model[4:-1].split(",")
+            ref_parts = metric_model[4:-1].split(",")
             if len(ref_parts) == 1:
                 target_model = ref_parts[0].strip(" \"'\t\r\n")
             elif len(ref_parts) == 2:
@@ -104,12 +175,13 @@ class DbtManifestTransformer:
             else:
                 ref_invalid_args(dbt_metric.name, ref_parts)
         else:
-            target_model = dbt_metric.model
+            target_model = metric_model
 
         assert target_model is not None, "Failed to set `target_model`"
 
         hashed = hash((target_model, target_package, self.manifest.metadata.project_id, dbt_metric.package_name))
-        if hashed not in self._resolved_dbt_model_refs:
+        node = self._resolved_dbt_model_refs.get(hashed)
+        if node is None:
             node = self.manifest.resolve_ref(
                 target_model_name=target_model,
                 target_model_package=target_package,
@@ -122,7 +194,7 @@ class DbtManifestTransformer:
 
             self._resolved_dbt_model_refs[hashed] = node
 
-        return self._resolved_dbt_model_refs[hashed]
+        return node
 
     @classmethod
     def db_table_from_model_node(cls, node: DbtModelNode) -> str:
@@ -132,16 +204,27 @@ class DbtManifestTransformer:
     def _build_dimension(self, name: str, dbt_metric: DbtMetric) -> Dimension:
         """Helper for `build_dimenions which builds either a categorical or time dimension"""
 
-        if name in self.time_dimension_stats.keys():
-            return Dimension(
+        # The same dimension names recur across many metrics; interning lets
+        # all the built Dimension objects share one string object per name.
+        name = sys.intern(name)
+        # A single probe tells us both whether this is a time dimension and
+        # which `DbtMetric.model`s it is primary for. This runs once per
+        # dimension of every metric, so avoid re-hashing the name.
+        primary_for_models = self.time_dimension_stats.get(name)
+        if primary_for_models is not None:
+            return self._build_element(
+                Dimension,
                 name=name,
                 type=DimensionType.TIME,
-                type_params=DimensionTypeParams(
-                    is_primary=dbt_metric.model in self.time_dimension_stats[name], time_granularity=TimeGranularity.DAY
+                type_params=self._build_element(
+                    DimensionTypeParams,
+                    is_primary=dbt_metric.model in primary_for_models,
+                    time_granularity=TimeGranularity.DAY,
                 ),
             )
         else:
-            return Dimension(
+            return self._build_element(
+                Dimension,
                 name=name,
                 type=DimensionType.CATEGORICAL,
             )
@@ -149,14 +232,17 @@ class DbtManifestTransformer:
     def build_dimensions(self, dbt_metric: DbtMetric) -> List[Dimension]:
         """Given a DbtMetric, builds all the associated MetricFlow dimensions"""
         dimensions = []
+        # Fetched once up front - each is otherwise re-read per dimension/filter below
+        metric_dimensions = dbt_metric.dimensions
+        metric_timestamp = dbt_metric.timestamp
 
         # Build dimensions specifically from DbtMetric.dimensions list
-        for dimension in dbt_metric.dimensions:
+        for dimension in metric_dimensions:
             dimensions.append(self._build_dimension(name=dimension, dbt_metric=dbt_metric))
 
         # Add DbtMetric.timestamp as a time dimension
-        if dbt_metric.timestamp is not None:
-            dimensions.append(self._build_dimension(name=dbt_metric.timestamp, dbt_metric=dbt_metric))
+        if metric_timestamp is not None:
+            dimensions.append(self._build_dimension(name=metric_timestamp, dbt_metric=dbt_metric))
 
         # We need to deduplicate the filters because a field could be the same in
         # two filters. For example, if two filters exist for `amount`, one with
@@ -166,7 +252,7 @@ class DbtManifestTransformer:
         # exclude when field is also listed as a DbtMetric.dimension
         # exclude when field is also the DbtMetric.timestamp
         for filter_field in distinct_dbt_metric_filter_fields:
-            if filter_field not in dbt_metric.dimensions and filter_field != dbt_metric.timestamp:
+            if filter_field not in metric_dimensions and filter_field != metric_timestamp:
                 dimensions.append(self._build_dimension(name=filter_field, dbt_metric=dbt_metric))
 
         return dimensions
@@ -180,8 +266,10 @@ class DbtManifestTransformer:
         if dbt_metric.calculation_method == "derived":
             raise RuntimeError("Cannot build a MetricFlow measure for `derived` DbtMetric")
 
-        return Measure(
-            name=dbt_metric.name,
+        return self._build_element(
+            Measure,
+            # Interned so the measure and its proxy metric share one string
+            name=sys.intern(dbt_metric.name),
             agg=CALC_METHOD_TO_MEASURE_TYPE[dbt_metric.calculation_method],
             expr=dbt_metric.expression,
             agg_time_dimension=dbt_metric.timestamp,
@@ -236,18 +324,22 @@ class DbtManifestTransformer:
             raise RuntimeError("Cannot build a MetricFlow proxy metric for `derived` DbtMetric")
 
         where_clause_constraint: Optional[WhereClauseConstraint] = None
-        if dbt_metric.filters:
+        metric_filters = dbt_metric.filters
+        if metric_filters:
             where_clause_constraint = WhereClauseConstraint(
-                where=self.build_where_stmt_from_filters(filters=dbt_metric.filters),
-                linkable_names=[filter.field for filter in dbt_metric.filters],
+                where=self.build_where_stmt_from_filters(filters=metric_filters),
+                linkable_names=[filter.field for filter in metric_filters],
             )
 
+        # One interned string backs the metric name, its input measure name,
+        # and the measure built from the same DbtMetric
+        name = sys.intern(dbt_metric.name)
         return Metric(
-            name=dbt_metric.name,
+            name=name,
             description=dbt_metric.description,
             type=MetricType.MEASURE_PROXY,
             type_params=MetricTypeParams(
-                measure=MetricInputMeasure(name=dbt_metric.name),
+                measure=MetricInputMeasure(name=name),
             ),
             constraint=where_clause_constraint,
         )
@@ -318,12 +410,14 @@ class DbtManifestTransformer:
             len(dbt_models) <= 1
         ), "Cannot merge data sources, all data sources to merge must have same dbt_model (or none)"
 
+        # `next(iter(...))` pulls the single element out of each set without
+        # allocating an intermediate list per attribute
         return DataSource(
-            name=list(names)[0],
-            description=list(descriptions)[0] if descriptions else None,
-            sql_table=list(sql_tables)[0] if sql_tables else None,
-            sql_query=list(sql_queries)[0] if sql_queries else None,
-            dbt_model=list(dbt_models)[0] if dbt_models else None,
+            name=next(iter(names)),
+            description=next(iter(descriptions)) if descriptions else None,
+            sql_table=next(iter(sql_tables)) if sql_tables else None,
+            sql_query=next(iter(sql_queries)) if sql_queries else None,
+            dbt_model=next(iter(dbt_models)) if dbt_models else None,
             dimensions=list(dimensions),
             identifiers=list(identifiers),
             measures=list(measures),
@@ -345,18 +439,25 @@ class DbtManifestTransformer:
         # dimenson for the data source that is built for the `DbtMetric.model`
         time_stats_for_metric_models: Dict[str, Dict[str, int]] = {}
         for dbt_metric in dbt_metrics:
-            if (
-                dbt_metric.calculation_method != "derived"
-                and dbt_metric.model is not None
-                and dbt_metric.timestamp is not None
-            ):
-                if dbt_metric.timestamp not in time_dimensions:
-                    time_dimensions[dbt_metric.timestamp] = []
-
-                if dbt_metric.model not in time_stats_for_metric_models:
-                    time_stats_for_metric_models[dbt_metric.model] = {dbt_metric.timestamp: 1}
-                else:
-                    time_stats_for_metric_models[dbt_metric.model][dbt_metric.timestamp] += 1
+            # Hoist the attribute reads - each was loaded up to three times
+            # per metric below. Callers on the hot path already hand us the
+            # pre-filtered `non_derived_metrics`, making the derived check a
+            # cheap guard for direct callers of this classmethod.
+            model = dbt_metric.model
+            timestamp = dbt_metric.timestamp
+            if model is None or timestamp is None or dbt_metric.calculation_method == "derived":
+                continue
+
+            if timestamp not in time_dimensions:
+                time_dimensions[timestamp] = []
+
+            model_stats = time_stats_for_metric_models.get(model)
+            if model_stats is None:
+                time_stats_for_metric_models[model] = {timestamp: 1}
+            else:
+                # `get` instead of indexing also handles a model appearing
+                # with a timestamp it hasn't been counted for yet
+                model_stats[timestamp] = model_stats.get(timestamp, 0) + 1
 
         # Take the mapping created above and set the `DbtMetric.model` values
         # that should be primary for the time dimension
@@ -366,6 +467,49 @@ class DbtManifestTransformer:
 
         return time_dimensions
 
+    def _stream_deduplicated_data_sources(
+        self, data_sources_map: DefaultDict[str, List[DataSource]], issues: Optional[List[ValidationIssue]] = None
+    ) -> Iterator[DataSource]:
+        """Yields the merged data source for each group in the map, draining it as it goes
+
+        Popping each group before merging releases the per-metric duplicate
+        data sources as soon as their merged result is yielded, instead of
+        holding both the groups and the finished results until the end. If
+        `issues` is given, merge failures are recorded there (matching
+        `build_user_configured_model`); otherwise they raise.
+        """
+        for name in list(data_sources_map):
+            data_sources = data_sources_map.pop(name)
+            try:
+                yield self.deduplicate_data_sources(data_sources)
+            except Exception as e:
+                if issues is None:
+                    raise
+                issues.append(
+                    ValidationError(
+                        message=f"Failed to merge data sources with the name `{name}`",
+                        extra_detail="".join(traceback.format_tb(e.__traceback__)),
+                    )
+                )
+
+    def build_data_sources_streaming(self) -> Iterator[DataSource]:
+        """Yields the manifest's deduplicated data sources one at a time
+
+        For consumers that process data sources independently, this avoids
+        materializing a full UserConfiguredModel. Deduplication still needs
+        every metric's data source before the first result can be yielded,
+        but the intermediates are released group by group as results stream
+        out. Note that `ModelTransformer`'s rules operate on a complete model
+        (e.g. attaching input measures to metrics), so streamed data sources
+        can't be run through the model transformations.
+        """
+        data_sources_map: DefaultDict[str, List[DataSource]] = defaultdict(list)
+        for dbt_metric in self.non_derived_metrics:
+            data_source = self.build_data_source_for_metric(dbt_metric)
+            data_sources_map[data_source.name].append(data_source)
+
+        yield from self._stream_deduplicated_data_sources(data_sources_map)
+
     def build_user_configured_model(self) -> ModelBuildResult:
         """Builds a UserConfiguredModel from the manifest of the instance
 
@@ -378,30 +522,32 @@ class DbtManifestTransformer:
         metrics = []
         issues: List[ValidationIssue] = []
 
-        for dbt_metric in self.manifest.metrics.values():
-            # TODO: Handle derived dbt metrics
-            if dbt_metric.calculation_method == "derived":
-                continue
-            else:
-                transformed_dbt_metric = self.dbt_metric_to_metricflow_elements(dbt_metric=dbt_metric)
-                data_sources_map[transformed_dbt_metric.data_source.name].append(transformed_dbt_metric.data_source)
-                metrics.append(transformed_dbt_metric.metric)
+        # TODO: Handle derived dbt metrics (`non_derived_metrics` skips them)
+        dbt_metrics = self.non_derived_metrics
+        # Each metric transforms independently, so fan the work out over a
+        # thread pool. Resolve the lazily-built time dimension stats first so
+        # worker threads don't race to build them; the resolved-ref cache only
+        # sees GIL-atomic dict reads/writes, which at worst re-resolve a ref.
+        self.time_dimension_stats
+        if len(dbt_metrics) > 1:
+            max_workers = min(32, (os.cpu_count() or 1) * 2)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # `map` preserves the input ordering of the results
+                transformed_dbt_metrics = list(executor.map(self.dbt_metric_to_metricflow_elements, dbt_metrics))
+        else:
+            transformed_dbt_metrics = [
+                self.dbt_metric_to_metricflow_elements(dbt_metric=dbt_metric) for dbt_metric in dbt_metrics
+            ]
+
+        for transformed_dbt_metric in transformed_dbt_metrics:
+            data_sources_map[transformed_dbt_metric.data_source.name].append(transformed_dbt_metric.data_source)
+            metrics.append(transformed_dbt_metric.metric)
 
         # As it might be the case that we generated many of the same data source,
         # we need to merge / dedupe them
-        deduped_data_sources = []
-        for name, data_sources in data_sources_map.items():
-            try:
-                deduped_data_sources.append(self.deduplicate_data_sources(data_sources))
-            except Exception as e:
-                issues.append(
-                    ValidationError(
-                        message=f"Failed to merge data sources with the name `{name}`",
-                        extra_detail="".join(traceback.format_tb(e.__traceback__)),
-                    )
-                )
+        deduped_data_sources = list(self._stream_deduplicated_data_sources(data_sources_map, issues=issues))
 
         return ModelBuildResult(
-            model=UserConfiguredModel(data_sources=list(deduped_data_sources), metrics=metrics),
+            model=UserConfiguredModel(data_sources=deduped_data_sources, metrics=metrics),
             issues=ModelValidationResults.from_issues_sequence(issues=issues),
         )
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import functools
 import itertools
 import logging
 import pprint
@@ -187,17 +188,29 @@ def hash_items(items: Sequence[SqlColumnType]) -> str:
 T = TypeVar("T", bound="ExtendedEnum")
 
 
+@functools.lru_cache(maxsize=None)
+def _enum_members_by_value(enum_class: Type[Enum]) -> Mapping:
+    """Maps member values to members for the given enum class
+
+    Built once per enum class so that case-insensitive member resolution is a
+    dict probe instead of a linear scan over the members. Enum classes are
+    created at import time, so the cache can never go stale.
+    """
+    return {member.value: member for member in enum_class}
+
+
 class ExtendedEnum(Enum):
     """Extension of standard Enum class with some extra utilities"""
 
     @classmethod
     def _missing_(cls: Type[T], value: Any) -> "ExtendedEnum":  # type: ignore[misc]
         """Make enums case insensitive"""
-        for member in cls:
-            if member.value == value.lower():
-                return member
-            if member.value == value.upper():
-                return member
+        members_by_value = _enum_members_by_value(cls)
+        member = members_by_value.get(value.lower())
+        if member is None:
+            member = members_by_value.get(value.upper())
+        if member is not None:
+            return member
 
         raise ValueError(f"Invalid enum value: `{value}` in enum {cls.__name__}")
 
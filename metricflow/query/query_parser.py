@@ -94,6 +94,12 @@ class MetricFlowQueryParser:
                 raise RuntimeError(f"Unhandled linkable type: {dimension.type}")
 
         self._known_metric_names = set(self._metric_semantics.metric_references)
+        # Precomputed suggestion candidates so a failed query doesn't have to
+        # re-enumerate the model's metric names before fuzzy matching.
+        self._metric_name_suggestion_candidates = [x.element_name for x in self._metric_semantics.metric_references]
+        # Valid group-by names depend on the queried metrics, so they are
+        # cached per metric-reference tuple as failed queries compute them.
+        self._group_by_name_candidates_cache: Dict[Tuple[MetricReference, ...], List[str]] = {}
         self._metric_time_dimension_reference = DataSet.metric_time_dimension_reference()
         self._time_granularity_solver = TimeGranularitySolver(
             semantic_model=self._model,
@@ -110,22 +116,34 @@ class MetricFlowQueryParser:
     ) -> Sequence[str]:
         """Return the top items (by edit distance) in candidate_items that fuzzy matches the given item."""
         # Rank choices by edit distance score.
-        # extract() return a tuple like (name, score)
-        top_ranked_suggestions = sorted(
-            fuzzywuzzy.process.extract(
-                # This scorer seems to return the best results.
-                item,
-                list(candidate_items),
-                limit=max_suggestions,
-                scorer=fuzzywuzzy.fuzz.token_set_ratio,
-            ),
-            # Put the highest scoring item at the top of the list.
-            key=lambda x: x[1],
-            reverse=True,
+        # extract() returns (name, score) tuples, already ordered with the
+        # highest scoring item at the top of the list.
+        top_ranked_suggestions = fuzzywuzzy.process.extract(
+            # This scorer seems to return the best results.
+            item,
+            candidate_items,
+            limit=max_suggestions,
+            scorer=fuzzywuzzy.fuzz.token_set_ratio,
         )
         # If the scores are too low, then it looks nonsensical, so remove those.
-        top_ranked_suggestions = [x for x in top_ranked_suggestions if x[1] > min_score]
-        return [x[0] for x in top_ranked_suggestions]
+        return [x[0] for x in top_ranked_suggestions if x[1] > min_score]
+
+    def _valid_group_by_names_for_metrics(self, metric_references: Sequence[MetricReference]) -> List[str]:
+        """The sorted qualified group-by names valid for the given metrics, used as suggestion candidates
+
+        Enumerating the element specs for a set of metrics scans the model, so
+        the result is cached per metric-reference tuple - repeated failing
+        queries against the same metrics skip the re-enumeration.
+        """
+        cache_key = tuple(metric_references)
+        candidates = self._group_by_name_candidates_cache.get(cache_key)
+        if candidates is None:
+            candidates = sorted(
+                x.qualified_name
+                for x in self._metric_semantics.element_specs_for_metrics(metric_references=list(metric_references))
+            )
+            self._group_by_name_candidates_cache[cache_key] = candidates
+        return candidates
 
     def parse_and_validate_query(
         self,
@@ -192,12 +210,10 @@ class MetricFlowQueryParser:
             identifier_specs=all_linkable_specs.identifier_specs,
         )
         if len(invalid_group_bys) > 0:
-            valid_group_by_names_for_metrics = sorted(
-                x.qualified_name
-                for x in self._metric_semantics.element_specs_for_metrics(metric_references=list(metric_references))
-            )
+            valid_group_by_names_for_metrics = self._valid_group_by_names_for_metrics(metric_references)
             # Create suggestions for invalid dimensions in case the user made a typo.
             suggestion_sections = {}
+            suggestions_by_name: Dict[str, List[str]] = {}
             for invalid_group_by in invalid_group_bys:
                 suggestions = MetricFlowQueryParser._top_fuzzy_matches(
                     item=invalid_group_by.qualified_name, candidate_items=valid_group_by_names_for_metrics
@@ -205,12 +221,14 @@ class MetricFlowQueryParser:
                 section_key = f"Suggestions for invalid dimension '{invalid_group_by.qualified_name}'"
                 section_value = pformat_big_objects(suggestions)
                 suggestion_sections[section_key] = section_value
+                suggestions_by_name[invalid_group_by.qualified_name] = list(suggestions)
             raise UnableToSatisfyQueryError(
                 f"Dimensions {[x.qualified_name for x in invalid_group_bys]} cannot be "
                 f"resolved for metrics {[x.element_name for x in metric_references]}. The invalid dimension may not "
                 f"exist, require an ambiguous join (e.g. a join path that can be satisfied in multiple ways), "
                 f"or require a fanout join.",
                 context=suggestion_sections,
+                suggestions=suggestions_by_name,
             )
 
     def _construct_metric_specs_for_query(
@@ -532,22 +550,19 @@ class MetricFlowQueryParser:
         # The config must be lower-case, so we lower case for case-insensitivity against query inputs from the user.
         metric_names = [x.lower() for x in metric_names]
 
-        known_metric_names = set(self._metric_semantics.metric_references)
         metric_references: List[MetricReference] = []
         for metric_name in metric_names:
             metric_reference = MetricReference(element_name=metric_name)
-            if metric_reference not in known_metric_names:
-                suggestions = {
-                    f"Suggestions for '{metric_name}'": pformat_big_objects(
-                        MetricFlowQueryParser._top_fuzzy_matches(
-                            item=metric_name,
-                            candidate_items=[x.element_name for x in self._metric_semantics.metric_references],
-                        )
-                    )
-                }
+            if metric_reference not in self._known_metric_names:
+                top_fuzzy_matches = MetricFlowQueryParser._top_fuzzy_matches(
+                    item=metric_name,
+                    candidate_items=self._metric_name_suggestion_candidates,
+                )
+                suggestion_sections = {f"Suggestions for '{metric_name}'": pformat_big_objects(top_fuzzy_matches)}
                 raise UnableToSatisfyQueryError(
                     f"Unknown metric: '{metric_name}'",
-                    context=suggestions,
+                    context=suggestion_sections,
+                    suggestions={metric_name: list(top_fuzzy_matches)},
                 )
             metric_references.append(metric_reference)
             if traverse_metric_inputs:
@@ -595,21 +610,17 @@ class MetricFlowQueryParser:
             elif IdentifierReference(element_name=element_name) in self._known_identifier_element_references:
                 identifier_specs.append(IdentifierSpec(element_name=element_name, identifier_links=identifier_links))
             else:
-                valid_group_by_names_for_metrics = sorted(
-                    x.qualified_name for x in self._metric_semantics.element_specs_for_metrics(list(metric_references))
-                )
+                valid_group_by_names_for_metrics = self._valid_group_by_names_for_metrics(metric_references)
 
-                suggestions = {
-                    f"Suggestions for '{qualified_name}'": pformat_big_objects(
-                        MetricFlowQueryParser._top_fuzzy_matches(
-                            item=qualified_name,
-                            candidate_items=valid_group_by_names_for_metrics,
-                        )
-                    )
-                }
+                top_fuzzy_matches = MetricFlowQueryParser._top_fuzzy_matches(
+                    item=qualified_name,
+                    candidate_items=valid_group_by_names_for_metrics,
+                )
+                suggestion_sections = {f"Suggestions for '{qualified_name}'": pformat_big_objects(top_fuzzy_matches)}
                 raise UnableToSatisfyQueryError(
                     f"Unknown element name '{element_name}' in dimension name '{qualified_name}'",
-                    context=suggestions,
+                    context=suggestion_sections,
+                    suggestions={qualified_name: list(top_fuzzy_matches)},
                 )
 
         return LinkableInstanceSpecs(